@@ -0,0 +1,539 @@
+"""
+Flappy Bird 
+Melhorias aplicadas:
+ - Estrutura em classes: Passaro, Cano, Chao, Assets, Game
+ - Config centralizado com dataclass
+ - Carregamento de assets centralizado (evita duplicação)
+ - Constantes nomeadas (sem "números mágicos")
+ - Game loop encapsulado em Game.run(); suporte a reiniciar sem sair do programa
+ - Docstrings e comentários explicativos
+ - Tipagem básica e pequenas melhorias de lógica
+
+"""
+
+import os
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Iterable, List, Optional, Tuple
+
+import pygame
+
+# -----------------------------
+# Configurações e constantes
+# -----------------------------
+
+@dataclass(frozen=True)
+class Config:
+    TELA_LARGURA: int = 500
+    TELA_ALTURA: int = 800
+    FPS: int = 30  # passos de física por segundo
+    LOOP_MAX_HZ: int = 120  # limite de iterações do laço principal (eventos e ritmo da física)
+    PASSOS_MAX_POR_QUADRO: int = 5  # evita espiral de atraso em máquinas lentas
+
+    # Física do pássaro
+    IMPULSO_PULO: float = -10.5
+    GRAVIDADE_TERMO: float = 1.5  # usado na fórmula de deslocamento
+    DESLOCAMENTO_MAX: float = 16
+
+    # Rotação / animação do pássaro
+    ROTACAO_MAXIMA: int = 25
+    VELOCIDADE_ROTACAO: int = 20
+    TEMPO_ANIMACAO: int = 5
+    ANGULO_MIN_ASA: int = -80
+
+    # Cano
+    DISTANCIA_CANO: int = 200
+    VELOCIDADE_CANO: int = 5
+    CANO_ALTURA_MIN: int = 50
+    CANO_ALTURA_MAX: int = 450
+
+    # Chão
+    VELOCIDADE_CHAO: int = 5
+
+    # Imagens
+    IMGS_DIR: str = "imgs"
+
+
+CFG = Config()
+
+# -----------------------------
+# Assets (centraliza carregamento)
+# -----------------------------
+
+class Assets:
+    """Carrega e guarda imagens e fontes para reutilização."""
+
+    def __init__(self, imgs_dir: str):
+        self.imgs_dir = imgs_dir
+        self._cache = {}
+        pygame.font.init()
+        self.font_pontos = pygame.font.SysFont('arial', 40)
+        self._texto_pontos = (None, None)  # (pontos, superfície renderizada)
+
+        # carregar imagens principais
+        self.pipe = self._carregar('pipe.png')
+        self.pipe_top = pygame.transform.flip(self.pipe, False, True).convert_alpha()
+        self.base = self._carregar('base.png', alpha=False)
+        self.bg = self._carregar('bg.png', alpha=False)
+        self.bird1 = self._carregar('bird1.png')
+        self.bird2 = self._carregar('bird2.png')
+        self.bird3 = self._carregar('bird3.png')
+
+        # máscaras de colisão dos canos, compartilhadas por todas as instâncias
+        self.pipe_mask = pygame.mask.from_surface(self.pipe)
+        self.pipe_top_mask = pygame.mask.from_surface(self.pipe_top)
+
+        # máscaras de colisão do pássaro (uma por quadro de animação)
+        self.bird_masks = [pygame.mask.from_surface(s) for s in self.imagens_passaro]
+
+        # sprites do pássaro já rotacionados para cada ângulo alcançável em Passaro.mover
+        self.rotated_birds = {
+            (i, a): pygame.transform.rotate(img, a).convert_alpha()
+            for i, img in enumerate(self.imagens_passaro)
+            for a in self._angulos_passaro()
+        }
+
+    def _carregar(self, filename: str, scale2x: bool = True, alpha: bool = True) -> pygame.Surface:
+        caminho = os.path.join(self.imgs_dir, filename)
+        if caminho in self._cache:
+            return self._cache[caminho]
+        surf = pygame.image.load(caminho).convert_alpha()
+        if scale2x:
+            surf = pygame.transform.scale2x(surf)
+        # garantir o formato de pixel da tela após a escala (blits mais rápidos);
+        # imagens opacas (fundo, chão) dispensam o canal alfa
+        surf = surf.convert_alpha() if alpha else surf.convert()
+        self._cache[caminho] = surf
+        return surf
+
+    @property
+    def imagens_passaro(self) -> List[pygame.Surface]:
+        return [self.bird1, self.bird2, self.bird3]
+
+    def texto_pontos(self, pontos: int) -> pygame.Surface:
+        """Texto da pontuação; só renderiza de novo quando os pontos mudam."""
+        if self._texto_pontos[0] != pontos:
+            # converter uma vez para o formato da tela: o texto é reutilizado em muitos quadros
+            texto = self.font_pontos.render(f"Pontuação: {pontos}", True, (255, 255, 255)).convert_alpha()
+            self._texto_pontos = (pontos, texto)
+        return self._texto_pontos[1]
+
+    @staticmethod
+    def _angulos_passaro() -> List[int]:
+        """Ângulos discretos que Passaro.mover pode produzir (partindo de 0 ou da rotação máxima)."""
+        angulos = set()
+        for angulo in (0, CFG.ROTACAO_MAXIMA):
+            angulos.add(angulo)
+            while angulo > CFG.ANGULO_MIN_ASA:
+                angulo -= CFG.VELOCIDADE_ROTACAO
+                angulos.add(angulo)
+        return sorted(angulos)
+
+    def passaro_rotacionado(self, img_idx: int, angulo: int) -> pygame.Surface:
+        """Retorna o sprite rotacionado, gerando e guardando caso o ângulo não esteja na tabela."""
+        chave = (img_idx, angulo)
+        surf = self.rotated_birds.get(chave)
+        if surf is None:
+            surf = pygame.transform.rotate(self.imagens_passaro[img_idx], angulo).convert_alpha()
+            self.rotated_birds[chave] = surf
+        return surf
+
+
+# -----------------------------
+# Física
+# -----------------------------
+
+def calcular_deslocamento(tempo: int, velocidade: float) -> float:
+    """Deslocamento vertical do pássaro no instante `tempo` desde o último pulo."""
+    deslocamento = CFG.GRAVIDADE_TERMO * (tempo ** 2) + velocidade * tempo
+
+    # limitar deslocamento (evita "teleporte" muito grande)
+    if deslocamento > CFG.DESLOCAMENTO_MAX:
+        deslocamento = CFG.DESLOCAMENTO_MAX
+    if deslocamento < 0:
+        deslocamento -= 2  # pequeno ajuste para subidas mais nítidas
+    return deslocamento
+
+
+# -----------------------------
+# Entidades do jogo
+# -----------------------------
+
+class Passaro:
+    """Representa o jogador (pássaro)."""
+
+    __slots__ = (
+        'x', 'y', 'assets', 'angulo', 'velocidade', 'altura_inicio_pulo', 'tempo',
+        'contagem_imagem', 'imagem', '_img_idx',
+    )
+
+    # quadro da animação para cada valor de contagem_imagem: asas 0 -> 1 -> 2 -> 1
+    _FRAMES = (0,) * CFG.TEMPO_ANIMACAO + (1,) * CFG.TEMPO_ANIMACAO + (2,) * CFG.TEMPO_ANIMACAO + (1,) * CFG.TEMPO_ANIMACAO
+
+    def __init__(self, x: int, y: int, assets: Assets):
+        self.x = x
+        self.y = y
+        self.assets = assets
+
+        # estado físico
+        self.angulo = 0
+        self.velocidade = 0.0
+        self.altura_inicio_pulo = y
+        self.tempo = 0
+
+        # animação
+        self.contagem_imagem = 0
+        self._img_idx = 0
+        self.imagem = self.assets.imagens_passaro[0]
+
+    def pular(self):
+        """Executa o impulso do pulo."""
+        self.velocidade = CFG.IMPULSO_PULO
+        self.tempo = 0
+        self.altura_inicio_pulo = self.y
+
+    def mover(self):
+        """Atualiza posição e ângulo conforme física simplificada."""
+        self.tempo += 1
+        deslocamento = calcular_deslocamento(self.tempo, self.velocidade)
+        self.y += deslocamento
+
+        # rotação do pássaro (mais bonito visualmente)
+        if deslocamento < 0 or self.y < (self.altura_inicio_pulo + 50):
+            if self.angulo < CFG.ROTACAO_MAXIMA:
+                self.angulo = CFG.ROTACAO_MAXIMA
+        else:
+            if self.angulo > CFG.ANGULO_MIN_ASA:
+                self.angulo -= CFG.VELOCIDADE_ROTACAO
+
+    def animar(self):
+        """Avança a animação das asas (um quadro por passo de física)."""
+        self.contagem_imagem = (self.contagem_imagem + 1) % len(self._FRAMES)
+        self._img_idx = self._FRAMES[self.contagem_imagem]
+
+        # quando está caindo bastante, não bater asas
+        if self.angulo <= CFG.ANGULO_MIN_ASA:
+            self._img_idx = 1
+            self.contagem_imagem = CFG.TEMPO_ANIMACAO * 2
+
+        self.imagem = self.assets.imagens_passaro[self._img_idx]
+
+    def desenhar(self, tela: pygame.Surface) -> pygame.Rect:
+        """Desenha o pássaro com a imagem atual e rotação; retorna a área afetada."""
+        # rotacionar mantendo o centro visual
+        imagem_rotacionada = self.assets.passaro_rotacionado(self._img_idx, self.angulo)
+        pos_centro = self.imagem.get_rect(topleft=(self.x, self.y)).center
+        rect = imagem_rotacionada.get_rect(center=pos_centro)
+        return tela.blit(imagem_rotacionada, rect.topleft)
+
+    def get_mask(self) -> pygame.Mask:
+        return self.assets.bird_masks[self._img_idx]
+
+    def get_rect(self) -> pygame.Rect:
+        return pygame.Rect(self.x, round(self.y), self.imagem.get_width(), self.imagem.get_height())
+
+
+class Cano:
+    """Cano com topo e base e lógica de colisão."""
+
+    __slots__ = (
+        'x', 'assets', 'altura', 'pos_topo', 'pos_base', 'CANO_TOPO', 'CANO_BASE',
+        'topo_width', 'topo_height', 'topo_mask', 'base_mask', 'passou',
+    )
+
+    def __init__(self, x: int, assets: Assets):
+        self.x = x
+        self.assets = assets
+        self.altura = 0
+        self.pos_topo = 0
+        self.pos_base = 0
+        self.CANO_TOPO = self.assets.pipe_top
+        self.CANO_BASE = self.assets.pipe
+        self.topo_width = self.CANO_TOPO.get_width()
+        self.topo_height = self.CANO_TOPO.get_height()
+        self.topo_mask = self.assets.pipe_top_mask
+        self.base_mask = self.assets.pipe_mask
+        self.passou = False
+        self.definir_altura()
+
+    def definir_altura(self):
+        self.altura = random.randrange(CFG.CANO_ALTURA_MIN, CFG.CANO_ALTURA_MAX)
+        self.pos_topo = self.altura - self.topo_height
+        self.pos_base = self.altura + CFG.DISTANCIA_CANO
+
+    def mover(self):
+        self.x -= CFG.VELOCIDADE_CANO
+
+    def blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Pares (imagem, posição) do topo e da base, para desenho em lote com Surface.blits."""
+        return [(self.CANO_TOPO, (self.x, self.pos_topo)), (self.CANO_BASE, (self.x, self.pos_base))]
+
+    def get_rects(self) -> Tuple[pygame.Rect, pygame.Rect]:
+        """Retângulos (topo, base) do cano na posição atual."""
+        # topo é o mesmo sprite espelhado: mesmas dimensões da base
+        topo_rect = pygame.Rect(self.x, self.pos_topo, self.topo_width, self.topo_height)
+        base_rect = pygame.Rect(self.x, self.pos_base, self.topo_width, self.topo_height)
+        return topo_rect, base_rect
+
+    def colidir_parte(self, passaro: Passaro, topo: bool) -> bool:
+        """Teste pixel a pixel contra o topo (topo=True) ou a base do cano."""
+        mask = self.topo_mask if topo else self.base_mask
+        pos_y = self.pos_topo if topo else self.pos_base
+        distancia = (self.x - passaro.x, pos_y - round(passaro.y))
+        return passaro.get_mask().overlap(mask, distancia) is not None
+
+    def colidir(self, passaro: Passaro) -> bool:
+        # teste rápido por retângulos antes da comparação pixel a pixel
+        passaro_rect = passaro.get_rect()
+        topo_rect, base_rect = self.get_rects()
+
+        if passaro_rect.colliderect(topo_rect) and self.colidir_parte(passaro, True):
+            return True
+        return passaro_rect.colliderect(base_rect) and self.colidir_parte(passaro, False)
+
+
+class Chao:
+    """Chão que se move horizontalmente (looping)."""
+
+    __slots__ = ('y', 'assets', 'VELOCIDADE', 'LARGURA', 'IMAGEM', 'x1', 'x2')
+
+    def __init__(self, y: int, assets: Assets):
+        self.y = y
+        self.assets = assets
+        self.VELOCIDADE = CFG.VELOCIDADE_CHAO
+        self.LARGURA = self.assets.base.get_width()
+        self.IMAGEM = self.assets.base
+        self.x1 = 0
+        self.x2 = self.LARGURA
+
+    def mover(self):
+        self.x1 -= self.VELOCIDADE
+        self.x2 -= self.VELOCIDADE
+
+        if self.x1 + self.LARGURA < 0:
+            self.x1 = self.x2 + self.LARGURA
+        if self.x2 + self.LARGURA < 0:
+            self.x2 = self.x1 + self.LARGURA
+
+    def desenhar(self, tela: pygame.Surface) -> List[pygame.Rect]:
+        return tela.blits(((self.IMAGEM, (self.x1, self.y)), (self.IMAGEM, (self.x2, self.y))))
+
+
+# -----------------------------
+# Funções utilitárias
+# -----------------------------
+
+def desenhar_tela(tela: pygame.Surface, assets: Assets, passaros: List[Passaro], canos: Iterable[Cano], chao: Chao, pontos: int,
+                  rects_anteriores: Optional[List[pygame.Rect]] = None) -> List[pygame.Rect]:
+    """Desenha toda a cena atual na tela.
+
+    Com `rects_anteriores` (o retorno da chamada anterior), só as regiões ocupadas no quadro
+    anterior voltam a receber o fundo e só elas e as novas são enviadas ao display; sem ele,
+    a tela inteira é redesenhada. Retorna as regiões ocupadas neste quadro.
+    """
+    # fora das regiões do quadro anterior a tela já contém apenas o fundo
+    if rects_anteriores is None:
+        tela.blit(assets.bg, (0, 0))
+    else:
+        for rect in rects_anteriores:
+            tela.blit(assets.bg, rect, area=rect)
+
+    rects = [passaro.desenhar(tela) for passaro in passaros]
+
+    # todos os canos em uma única chamada de blit
+    blits_canos = []
+    for cano in canos:
+        blits_canos += cano.blits()
+    rects += tela.blits(blits_canos)
+
+    texto = assets.texto_pontos(pontos)
+    rects.append(tela.blit(texto, (CFG.TELA_LARGURA - 10 - texto.get_width(), 10)))
+
+    rects += chao.desenhar(tela)
+
+    # blits fora da tela retornam retângulos vazios
+    rects = [rect for rect in rects if rect.width and rect.height]
+    if rects_anteriores is None:
+        pygame.display.update()
+    else:
+        pygame.display.update(rects_anteriores + rects)
+    return rects
+
+
+# -----------------------------
+# Game controller
+# -----------------------------
+
+class Game:
+    """Encapsula o loop do jogo e o estado para facilitar reinício e testes."""
+
+    def __init__(self):
+        pygame.init()
+        pygame.display.set_caption("Flappy - Rework")
+        self.tela = pygame.display.set_mode((CFG.TELA_LARGURA, CFG.TELA_ALTURA))
+        self.clock = pygame.time.Clock()
+        self.assets = Assets(CFG.IMGS_DIR)
+        self.reset()
+
+    def reset(self):
+        """Prepara um novo estado de jogo (reinício rápido)."""
+        self.passaros: List[Passaro] = [Passaro(230, 350, self.assets)]
+        self.chao = Chao(730, self.assets)
+        # canos saem da tela na ordem em que entram (FIFO)
+        self.canos: Deque[Cano] = deque([Cano(700, self.assets)])
+        self.pontos = 0
+        self.rodando = True
+        self._rects_tela: Optional[List[pygame.Rect]] = None  # None força redesenho completo
+
+    def processar_eventos(self):
+        for evento in pygame.event.get():
+            if evento.type == pygame.QUIT:
+                self.rodando = False
+            elif evento.type == pygame.KEYDOWN:
+                if evento.key == pygame.K_SPACE:
+                    for p in self.passaros:
+                        p.pular()
+                elif evento.key == pygame.K_r:
+                    # tecla R reinicia o jogo
+                    self.reset()
+
+    def atualizar_estado(self):
+        # mover elementos
+        for p in self.passaros:
+            p.mover()
+        self.chao.mover()
+
+        adicionar_cano = False
+
+        # fase ampla: um collidelistall por pássaro contra os retângulos dos canos;
+        # só os retângulos atingidos passam pelo teste de máscara
+        rects = []
+        donos = []
+        if self.passaros:
+            # canos cuja faixa horizontal não cruza a de nenhum pássaro (na prática,
+            # todos menos um) nem entram na lista
+            x_min = min(p.x for p in self.passaros)
+            x_max = max(p.x + p.imagem.get_width() for p in self.passaros)
+            for idx_cano, cano in enumerate(self.canos):
+                if cano.x >= x_max or cano.x + cano.topo_width <= x_min:
+                    continue
+                topo_rect, base_rect = cano.get_rects()
+                rects.append(topo_rect)
+                rects.append(base_rect)
+                donos.append((idx_cano, cano, True))
+                donos.append((idx_cano, cano, False))
+
+        # índice do pássaro -> índice do primeiro cano com que colidiu (removido após o laço)
+        mortos = {}
+        for i, p in enumerate(self.passaros):
+            for h in p.get_rect().collidelistall(rects):
+                idx_cano, cano, topo = donos[h]
+                if cano.colidir_parte(p, topo):
+                    mortos[i] = idx_cano
+                    break
+
+        for idx_cano, cano in enumerate(self.canos):
+            for i, p in enumerate(self.passaros):
+                # pássaro morto em um cano anterior não pontua mais
+                if mortos.get(i, idx_cano) < idx_cano:
+                    continue
+                if not cano.passou and p.x > cano.x:
+                    cano.passou = True
+                    adicionar_cano = True
+
+            cano.mover()
+
+        if adicionar_cano:
+            self.pontos += 1
+            self.canos.append(Cano(CFG.TELA_LARGURA + 100, self.assets))
+
+        while self.canos and self.canos[0].x + self.canos[0].topo_width < 0:
+            self.canos.popleft()
+
+        # verificar colisão com chão/teto e remover, numa única passada, todos os pássaros mortos
+        self.passaros = [
+            p for i, p in enumerate(self.passaros)
+            if i not in mortos and 0 <= p.y and (p.y + p.imagem.get_height()) <= self.chao.y
+        ]
+
+        # animação avança com a física, não com a taxa de desenho
+        for p in self.passaros:
+            p.animar()
+
+        # se não houver pássaros, marcar fim de rodada
+        if not self.passaros:
+            # pausa pequena e reset automático pode ser substituído por tela de Game Over
+            self.rodando = False
+
+    def run(self):
+        """Loop principal do jogo. Retorna quando o jogador fecha a janela."""
+        while True:
+            # permitir reiniciar o jogo após fim sem fechar a janela
+            self.rodando = True
+            # física em passo fixo (CFG.FPS); a tela só é redesenhada quando o estado avançou
+            passo = 1 / CFG.FPS
+            acumulado = 0.0
+            ultimo = time.perf_counter()
+            while self.rodando:
+                agora = time.perf_counter()
+                acumulado = min(acumulado + agora - ultimo, passo * CFG.PASSOS_MAX_POR_QUADRO)
+                ultimo = agora
+
+                self.processar_eventos()
+                avancou = False
+                while self.rodando and acumulado >= passo:
+                    self.atualizar_estado()
+                    acumulado -= passo
+                    avancou = True
+
+                if avancou:
+                    self._rects_tela = desenhar_tela(
+                        self.tela, self.assets, self.passaros, self.canos, self.chao, self.pontos, self._rects_tela
+                    )
+                self.clock.tick(CFG.LOOP_MAX_HZ)
+
+            # Game over: apresentar mensagem e esperar ação do usuário
+            self.mostrar_game_over()
+
+            # esperar evento do usuário: R para reiniciar, ESC ou fechar para sair
+            espera = True
+            while espera:
+                for evento in pygame.event.get():
+                    if evento.type == pygame.QUIT:
+                        pygame.quit()
+                        return
+                    elif evento.type == pygame.KEYDOWN:
+                        if evento.key == pygame.K_r:
+                            self.reset()
+                            espera = False
+                        elif evento.key == pygame.K_ESCAPE:
+                            pygame.quit()
+                            return
+
+    def mostrar_game_over(self):
+        """Desenha uma tela simples de Game Over com instruções."""
+        # desenhar última imagem do jogo como fundo
+        self.tela.blit(self.assets.bg, (0, 0))
+        texto_final = self.assets.font_pontos.render("Game Over", True, (255, 0, 0))
+        texto_instr = self.assets.font_pontos.render("Pressione R para reiniciar ou Esc para sair", True, (255, 255, 255))
+        score_text = self.assets.texto_pontos(self.pontos)
+
+        self.tela.blit(texto_final, ((CFG.TELA_LARGURA - texto_final.get_width()) // 2, 200))
+        self.tela.blit(score_text, ((CFG.TELA_LARGURA - score_text.get_width()) // 2, 300))
+        self.tela.blit(texto_instr, ((CFG.TELA_LARGURA - texto_instr.get_width()) // 2, 380))
+        pygame.display.update()
+
+
+# -----------------------------
+# Entrypoint
+# -----------------------------
+
+def main():
+    game = Game()
+    game.run()
+
+
+if __name__ == '__main__':
+    main()